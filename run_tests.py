@@ -55,12 +55,15 @@ def run_determinism_tests(verbose: bool = False) -> int:
     return run_command(cmd)
 
 
-def run_compliance_tests(verbose: bool = False) -> int:
+def run_compliance_tests(verbose: bool = False, parallel: bool = False) -> int:
     """Run compliance tests."""
     print("Running compliance tests...")
     cmd = ["python", "-m", "pytest", "tests/compliance/"]
     if verbose:
         cmd.append("-v")
+    if parallel:
+        # Compliance tests are independent; keep each module on one worker
+        cmd.extend(["-n", "auto", "--dist=loadfile"])
     return run_command(cmd)
 
 
@@ -75,12 +78,16 @@ def run_performance_tests(verbose: bool = False, parallel: bool = False) -> int:
     return run_command(cmd)
 
 
-def run_e2e_tests(verbose: bool = False) -> int:
+def run_e2e_tests(verbose: bool = False, parallel: bool = False) -> int:
     """Run end-to-end tests."""
     print("Running end-to-end tests...")
     cmd = ["python", "-m", "pytest", "tests/e2e/"]
     if verbose:
         cmd.append("-v")
+    if parallel:
+        # Each workflow test builds its own case, so tests shard freely;
+        # xdist_group-marked modules share one worker and its session fixtures
+        cmd.extend(["-n", "auto", "--dist", "loadgroup"])
     return run_command(cmd)
 
 
@@ -91,7 +98,7 @@ def run_all_tests(verbose: bool = False, parallel: bool = False) -> int:
     if verbose:
         cmd.append("-v")
     if parallel:
-        cmd.extend(["-n", "auto"])
+        cmd.extend(["-n", "auto", "--dist", "loadgroup"])
     return run_command(cmd)
 
 
@@ -166,7 +173,7 @@ def main():
     parser.add_argument(
         "-p", "--parallel",
         action="store_true",
-        help="Run tests in parallel (for performance tests)"
+        help="Run tests in parallel (for compliance, performance and e2e tests)"
     )
     
     parser.add_argument(
@@ -193,11 +200,11 @@ def main():
         elif args.test_type == "determinism":
             exit_code = run_determinism_tests(args.verbose)
         elif args.test_type == "compliance":
-            exit_code = run_compliance_tests(args.verbose)
+            exit_code = run_compliance_tests(args.verbose, args.parallel)
         elif args.test_type == "performance":
             exit_code = run_performance_tests(args.verbose, args.parallel)
         elif args.test_type == "e2e":
-            exit_code = run_e2e_tests(args.verbose)
+            exit_code = run_e2e_tests(args.verbose, args.parallel)
         elif args.test_type == "all":
             exit_code = run_all_tests(args.verbose, args.parallel)
         elif args.test_type == "coverage":
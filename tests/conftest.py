@@ -6,183 +6,293 @@ for all test modules in the project.
 
 import pytest
 import asyncio
-import tempfile
+import copy
+import functools
+import gc
+import io
 import os
+import shutil
+import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
-from typing import Dict, Any, List
+from types import MappingProxyType, SimpleNamespace
+from typing import Dict, Any, List, Optional
 import json
 
-# Import models
-from services.shared.models.case import Case, CaseMode, CaseType, CaseStatus
-from services.shared.models.evidence import Evidence, EvidenceType, EvidenceStatus
-from services.shared.models.storyboard import Storyboard, StoryboardStatus
-from services.shared.models.timeline import Timeline, TimelineStatus
-from services.shared.models.render import RenderJob, RenderStatus
+from tests.json_helpers import dumps
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+
+# Minimal mono 16-bit 44.1 kHz WAV header followed by 2 KB of silence
+_SAMPLE_WAV_BYTES = (
+    b'RIFF\x24\x08\x00\x00WAVEfmt \x10\x00\x00\x00\x01\x00\x01\x00\x44\xac\x00\x00\x88X\x01\x00\x02\x00\x10\x00data\x00\x08\x00\x00' +
+    b'\x00' * 2048
+)
+
+_TEST_CONFIG = {
+    "test_mode": True,
+    "jurisdiction": "federal",
+    "render_profile": "neutral",
+    "timeout": 30
+}
+_TEST_CONFIG_BYTES = dumps(_TEST_CONFIG)
+
+
+# Read-only chain of custody for the test evidence
+_CHAIN_OF_CUSTODY = (
+    MappingProxyType({
+        "action": "collected",
+        "user": "Officer Smith",
+        "timestamp": "2024-01-01T10:00:00Z",
+        "checksum": "test_hash_123"
+    }),
+    MappingProxyType({
+        "action": "transferred",
+        "user": "Detective Jones",
+        "timestamp": "2024-01-01T11:00:00Z",
+        "checksum": "test_hash_123"
+    })
+)
+
+# Read-only scenarios for different use cases; modes hold CaseMode values and
+# are resolved to members by _case_scenarios()
+_SCENARIOS = MappingProxyType({
+    "simple_case": MappingProxyType({
+        "case_type": "civil",
+        "jurisdiction": "federal",
+        "evidence_count": 2,
+        "scene_count": 1,
+        "expected_duration": 10.0
+    }),
+    "complex_case": MappingProxyType({
+        "case_type": "criminal",
+        "jurisdiction": "california",
+        "evidence_count": 10,
+        "scene_count": 5,
+        "expected_duration": 60.0
+    }),
+    "demonstrative_case": MappingProxyType({
+        "case_type": "civil",
+        "jurisdiction": "federal",
+        "mode": "demonstrative",
+        "evidence_count": 5,
+        "scene_count": 3,
+        "expected_duration": 30.0,
+        "accuracy_required": 0.95
+    }),
+    "sandbox_case": MappingProxyType({
+        "case_type": "criminal",
+        "jurisdiction": "texas",
+        "mode": "sandbox",
+        "evidence_count": 8,
+        "scene_count": 4,
+        "expected_duration": 45.0,
+        "allow_speculation": True
+    })
+})
+
+
+def _mock(attrs: Optional[Dict[str, Any]] = None, **returns: Any) -> Mock:
+    """Build a synchronous service mock with the given method return values."""
+    mock = Mock(**(attrs or {}))
+    mock.configure_mock(**{f"{name}.return_value": value for name, value in returns.items()})
+    return mock
+
+
+@functools.lru_cache(maxsize=1)
+def _case_scenarios() -> MappingProxyType:
+    """Return _SCENARIOS with each ``mode`` resolved to its ``CaseMode`` member."""
+    from services.shared.models.case import CaseMode
+    return MappingProxyType({
+        name: MappingProxyType({**scenario, "mode": CaseMode(scenario["mode"])})
+        if "mode" in scenario else scenario
+        for name, scenario in _SCENARIOS.items()
+    })
+
+
+@functools.lru_cache(maxsize=1)
+def _sample_png_bytes() -> bytes:
+    """Encode the blank sample image once; compression is skipped on purpose."""
+    from PIL import Image
+    buffer = io.BytesIO()
+    Image.new('RGB', (800, 600), color='white').save(buffer, format='PNG', compress_level=0)
+    return buffer.getvalue()
 
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        yield Path(tmp_dir)
-
-
-@pytest.fixture
 def test_case_data():
-    """Provide test case data."""
-    return {
+    """Provide read-only test case data."""
+    return MappingProxyType({
         "id": "test-case-001",
-        "metadata": {
+        "metadata": MappingProxyType({
             "case_number": "24-cv-001",
             "title": "Test Legal Case",
-            "case_type": CaseType.CIVIL,
+            "case_type": "civil",
             "jurisdiction": "federal",
             "court": "US District Court",
             "created_by": "test_user"
-        },
-        "status": CaseStatus.ACTIVE
-    }
+        }),
+        "status": "active"
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_evidence_data():
-    """Provide test evidence data."""
-    return {
+    """Provide read-only test evidence data."""
+    return MappingProxyType({
         "id": "test-evidence-001",
-        "evidence_type": EvidenceType.DOCUMENT,
-        "metadata": {
+        "evidence_type": "document",
+        "metadata": MappingProxyType({
             "filename": "test_document.pdf",
             "content_type": "application/pdf",
             "size_bytes": 1024,
             "checksum": "test_hash_123",
             "uploaded_by": "test_user"
-        },
-        "status": EvidenceStatus.UPLOADED,
+        }),
+        "status": "uploaded",
         "case_id": "test-case-001",
-        "chain_of_custody": [
-            {
-                "action": "collected",
-                "user": "Officer Smith",
-                "timestamp": "2024-01-01T10:00:00Z",
-                "checksum": "test_hash_123"
-            },
-            {
-                "action": "transferred",
-                "user": "Detective Jones", 
-                "timestamp": "2024-01-01T11:00:00Z",
-                "checksum": "test_hash_123"
-            }
-        ]
-    }
+        "chain_of_custody": _CHAIN_OF_CUSTODY
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_storyboard_data():
-    """Provide test storyboard data."""
-    return {
+    """Provide read-only test storyboard data."""
+    return MappingProxyType({
         "id": "test-storyboard-001",
-        "metadata": {
+        "metadata": MappingProxyType({
             "title": "Test Storyboard",
             "description": "Test storyboard content with evidence references",
             "case_id": "test-case-001",
             "created_by": "test_user"
-        },
-        "status": StoryboardStatus.DRAFT,
-        "scenes": []
-    }
+        }),
+        "status": "draft",
+        "scenes": ()
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_case(test_case_data):
-    """Create a test case instance."""
-    from services.shared.models.case import CaseMetadata
-    metadata = CaseMetadata(**test_case_data["metadata"])
+    """Create a shared test case instance; use ``test_case_mutable`` to modify it."""
+    from services.shared.models.case import Case, CaseMetadata, CaseStatus, CaseType
+    metadata = CaseMetadata(**{
+        **test_case_data["metadata"],
+        "case_type": CaseType(test_case_data["metadata"]["case_type"])
+    })
     return Case(
         id=test_case_data["id"],
         metadata=metadata,
-        status=test_case_data["status"]
+        status=CaseStatus(test_case_data["status"])
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_evidence(test_evidence_data):
-    """Create a test evidence instance."""
-    from services.shared.models.evidence import EvidenceMetadata
+    """Create a shared test evidence instance; use ``test_evidence_mutable`` to modify it."""
+    from services.shared.models.evidence import (
+        Evidence, EvidenceMetadata, EvidenceStatus, EvidenceType
+    )
     metadata = EvidenceMetadata(**test_evidence_data["metadata"])
     return Evidence(
         id=test_evidence_data["id"],
-        evidence_type=test_evidence_data["evidence_type"],
+        evidence_type=EvidenceType(test_evidence_data["evidence_type"]),
         metadata=metadata,
-        status=test_evidence_data["status"],
+        status=EvidenceStatus(test_evidence_data["status"]),
         case_id=test_evidence_data["case_id"],
-        chain_of_custody=test_evidence_data["chain_of_custody"]
+        chain_of_custody=[dict(entry) for entry in test_evidence_data["chain_of_custody"]]
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_storyboard(test_storyboard_data):
-    """Create a test storyboard instance."""
-    from services.shared.models.storyboard import StoryboardMetadata
+    """Create a shared test storyboard instance; use ``test_storyboard_mutable`` to modify it."""
+    from services.shared.models.storyboard import (
+        Storyboard, StoryboardMetadata, StoryboardStatus
+    )
     metadata = StoryboardMetadata(**test_storyboard_data["metadata"])
     return Storyboard(
         id=test_storyboard_data["id"],
         metadata=metadata,
-        status=test_storyboard_data["status"],
-        scenes=test_storyboard_data["scenes"]
+        status=StoryboardStatus(test_storyboard_data["status"]),
+        scenes=list(test_storyboard_data["scenes"])
     )
 
 
+@pytest.fixture
+def test_case_mutable(test_case):
+    """Provide a private copy of the shared test case."""
+    return copy.deepcopy(test_case)
+
+
+@pytest.fixture
+def test_evidence_mutable(test_evidence):
+    """Provide a private copy of the shared test evidence."""
+    return copy.deepcopy(test_evidence)
+
+
+@pytest.fixture
+def test_storyboard_mutable(test_storyboard):
+    """Provide a private copy of the shared test storyboard."""
+    return copy.deepcopy(test_storyboard)
+
+
 @pytest.fixture
 def mock_database_service():
     """Create a mock database service."""
-    with patch('services.shared.services.database_service.DatabaseService') as mock_db:
-        mock_db.return_value.connection = Mock()
-        mock_db.return_value.create_case.return_value = Mock(success=True)
-        mock_db.return_value.get_case.return_value = Mock(id="test-case-001")
-        mock_db.return_value.create_evidence.return_value = Mock(success=True)
-        mock_db.return_value.create_storyboard.return_value = Mock(success=True)
-        mock_db.return_value.create_timeline.return_value = Mock(success=True)
-        mock_db.return_value.create_render_job.return_value = Mock(success=True)
-        yield mock_db.return_value
+    return _mock(
+        attrs={"connection": Mock()},
+        create_case=SimpleNamespace(success=True),
+        get_case=SimpleNamespace(id="test-case-001"),
+        create_evidence=SimpleNamespace(success=True),
+        create_storyboard=SimpleNamespace(success=True),
+        create_timeline=SimpleNamespace(success=True),
+        create_render_job=SimpleNamespace(success=True)
+    )
 
 
 @pytest.fixture
-def mock_storage_service(temp_dir):
+def patched_database_service(mock_database_service):
+    """Patch DatabaseService so that constructing it yields the mock."""
+    with patch(
+        'services.shared.services.database_service.DatabaseService',
+        return_value=mock_database_service
+    ):
+        yield mock_database_service
+
+
+@pytest.fixture
+def mock_storage_service(tmp_path):
     """Create a mock storage service."""
-    with patch('services.shared.implementations.storage.local_storage.LocalStorage') as mock_storage:
-        mock_storage.return_value.base_path = temp_dir
-        mock_storage.return_value.write.return_value = Mock(success=True)
-        mock_storage.return_value.read.return_value = b"test content"
-        mock_storage.return_value.exists.return_value = True
-        yield mock_storage.return_value
+    return _mock(
+        attrs={"base_path": tmp_path},
+        write=SimpleNamespace(success=True),
+        read=b"test content",
+        exists=True
+    )
 
 
 @pytest.fixture
 def mock_ocr_service():
     """Create a mock OCR service."""
-    with patch('services.shared.implementations.ocr.tesseract_local.TesseractLocalOCR') as mock_ocr:
-        mock_ocr.return_value.extract_text.return_value = Mock(
+    return _mock(
+        extract_text=SimpleNamespace(
             extracted_text="Extracted text content",
             confidence_score=0.95,
             processing_time=2.5
         )
-        yield mock_ocr.return_value
+    )
 
 
 @pytest.fixture
 def mock_asr_service():
     """Create a mock ASR service."""
-    with patch('services.shared.implementations.asr.whisperx_local.WhisperXLocalASR') as mock_asr:
-        mock_asr.return_value.extract_text.return_value = Mock(
+    return _mock(
+        extract_text=SimpleNamespace(
             transcript="This is a test transcript",
             confidence_score=0.92,
             segments=[
@@ -190,42 +300,53 @@ def mock_asr_service():
                 {"start": 2.0, "end": 4.0, "text": "transcript", "confidence": 0.89}
             ]
         )
-        yield mock_asr.return_value
+    )
 
 
 @pytest.fixture
 def mock_renderer_service():
     """Create a mock renderer service."""
-    with patch('services.render_orchestrator.implementations.blender.local_renderer.BlenderLocalRenderer') as mock_renderer:
-        mock_renderer.return_value.render.return_value = Mock(
+    return _mock(
+        render=SimpleNamespace(
             output_path="/path/to/render.mp4",
             success=True,
             render_time=30.0,
             frames_generated=720,
             checksums={"frame_001": "hash_001", "frame_002": "hash_002"}
         )
-        yield mock_renderer.return_value
+    )
 
 
 @pytest.fixture
 def mock_policy_service():
     """Create a mock policy service."""
-    with patch('services.shared.interfaces.policy.PolicyService') as mock_policy:
-        mock_policy.return_value.validate_case.return_value = []
-        mock_policy.return_value.validate_evidence.return_value = []
-        mock_policy.return_value.validate_storyboard.return_value = []
-        mock_policy.return_value.validate_render_job.return_value = []
-        mock_policy.return_value.get_jurisdiction_rules.return_value = {
+    return _mock(
+        validate_case=[],
+        validate_evidence=[],
+        validate_storyboard=[],
+        validate_render_job=[],
+        get_jurisdiction_rules={
             "evidence_requirements": {"chain_of_custody": True},
             "demonstrative_standards": {"accuracy_required": 0.95}
         }
-        yield mock_policy.return_value
+    )
 
 
-@pytest.fixture
-def test_data_directory(temp_dir):
-    """Create a test data directory with sample files."""
-    data_dir = temp_dir / "test_data"
+@pytest.fixture(scope="session")
+def fast_tmp_root():
+    """Provide a per-worker scratch root, on tmpfs (/dev/shm) when available."""
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    shm = Path("/dev/shm")
+    base = shm if shm.is_dir() else Path(tempfile.gettempdir())
+    root = Path(tempfile.mkdtemp(prefix=f"pytest-{worker_id}-", dir=base))
+    yield root
+    shutil.rmtree(root, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def test_data_directory(fast_tmp_root):
+    """Create a shared, read-only test data directory with sample files."""
+    data_dir = fast_tmp_root / "test_data"
     data_dir.mkdir()
     
     # Create sample document
@@ -234,60 +355,78 @@ def test_data_directory(temp_dir):
     
     # Create sample audio file (minimal WAV)
     audio_file = data_dir / "sample_audio.wav"
-    audio_file.write_bytes(
-        b'RIFF\x24\x08\x00\x00WAVEfmt \x10\x00\x00\x00\x01\x00\x01\x00\x44\xac\x00\x00\x88X\x01\x00\x02\x00\x10\x00data\x00\x08\x00\x00' + 
-        b'\x00' * 2048
-    )
+    audio_file.write_bytes(_SAMPLE_WAV_BYTES)
     
     # Create sample image
-    from PIL import Image
-    img = Image.new('RGB', (800, 600), color='white')
     img_file = data_dir / "sample_image.png"
-    img.save(img_file)
+    img_file.write_bytes(_sample_png_bytes())
     
     # Create test configuration
     config_file = data_dir / "test_config.json"
-    config_file.write_text(json.dumps({
-        "test_mode": True,
-        "jurisdiction": "federal",
-        "render_profile": "neutral",
-        "timeout": 30
-    }))
+    config_file.write_bytes(_TEST_CONFIG_BYTES)
     
     return data_dir
 
 
+@pytest.fixture
+def test_data_directory_rw(test_data_directory, tmp_path):
+    """Provide a private, writable copy of the sample data directory."""
+    return Path(shutil.copytree(test_data_directory, tmp_path / "test_data"))
+
+
 @pytest.fixture
 def performance_monitor():
     """Create a performance monitoring fixture."""
+    import statistics
+    import sys
     import time
-    import psutil
+    from array import array
+    try:
+        import resource
+    except ImportError:  # Windows
+        resource = None
+    
+    def memory_mb():
+        """Peak RSS via a single getrusage() call; psutil where unavailable."""
+        if resource is None:
+            import psutil
+            return psutil.Process().memory_info().rss / 1024 / 1024
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is reported in bytes on macOS and KiB elsewhere
+        if sys.platform == "darwin":
+            return max_rss / 1024 / 1024
+        return max_rss / 1024
     
     class PerformanceMonitor:
         def __init__(self):
             self.start_time = None
             self.start_memory = None
             self.measurements = []
+            # Flat float buffers feeding get_summary's C-level reductions
+            self._durations = array('d')
+            self._memory_increases = array('d')
         
         def start(self):
-            self.start_time = time.time()
-            self.start_memory = psutil.Process().memory_info().rss / 1024 / 1024  # MB
+            self.start_time = time.perf_counter_ns()
+            self.start_memory = memory_mb()
         
         def stop(self):
             if self.start_time is None:
                 return None
             
-            end_time = time.time()
-            end_memory = psutil.Process().memory_info().rss / 1024 / 1024  # MB
+            end_time = time.perf_counter_ns()
+            end_memory = memory_mb()
             
             measurement = {
-                "duration": end_time - self.start_time,
+                "duration": (end_time - self.start_time) / 1e9,
                 "memory_start": self.start_memory,
                 "memory_end": end_memory,
                 "memory_increase": end_memory - self.start_memory
             }
             
             self.measurements.append(measurement)
+            self._durations.append(measurement["duration"])
+            self._memory_increases.append(measurement["memory_increase"])
             return measurement
         
         def get_summary(self):
@@ -296,74 +435,57 @@ def performance_monitor():
             
             return {
                 "total_measurements": len(self.measurements),
-                "avg_duration": sum(m["duration"] for m in self.measurements) / len(self.measurements),
-                "max_duration": max(m["duration"] for m in self.measurements),
-                "avg_memory_increase": sum(m["memory_increase"] for m in self.measurements) / len(self.measurements),
-                "max_memory_increase": max(m["memory_increase"] for m in self.measurements)
+                "avg_duration": statistics.fmean(self._durations),
+                "max_duration": max(self._durations),
+                "avg_memory_increase": statistics.fmean(self._memory_increases),
+                "max_memory_increase": max(self._memory_increases)
             }
     
     return PerformanceMonitor()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_scenarios():
-    """Provide test scenarios for different use cases."""
-    return {
-        "simple_case": {
-            "case_type": "civil",
-            "jurisdiction": "federal",
-            "evidence_count": 2,
-            "scene_count": 1,
-            "expected_duration": 10.0
-        },
-        "complex_case": {
-            "case_type": "criminal",
-            "jurisdiction": "california",
-            "evidence_count": 10,
-            "scene_count": 5,
-            "expected_duration": 60.0
-        },
-        "demonstrative_case": {
-            "case_type": "civil",
-            "jurisdiction": "federal",
-            "mode": CaseMode.DEMONSTRATIVE,
-            "evidence_count": 5,
-            "scene_count": 3,
-            "expected_duration": 30.0,
-            "accuracy_required": 0.95
-        },
-        "sandbox_case": {
-            "case_type": "criminal",
-            "jurisdiction": "texas",
-            "mode": CaseMode.SANDBOX,
-            "evidence_count": 8,
-            "scene_count": 4,
-            "expected_duration": 45.0,
-            "allow_speculation": True
-        }
-    }
+    """Provide read-only test scenarios for different use cases."""
+    return _case_scenarios()
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def setup_test_environment():
-    """Setup test environment before each test."""
-    # Set test environment variables
-    os.environ["TESTING"] = "true"
-    os.environ["LOG_LEVEL"] = "DEBUG"
-    
-    # Mock external dependencies
-    with patch('services.shared.database.init_database') as mock_init:
-        mock_init.return_value = Mock()
+    """Set test environment variables once for the session."""
+    test_env = {"TESTING": "true", "LOG_LEVEL": "DEBUG"}
+    previous = {key: os.environ.get(key) for key in test_env}
+    os.environ.update(test_env)
+    try:
         yield
-    
-    # Cleanup after test
-    if "TESTING" in os.environ:
-        del os.environ["TESTING"]
-    if "LOG_LEVEL" in os.environ:
-        del os.environ["LOG_LEVEL"]
+    finally:
+        # Restore whatever was set before the session
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
 
 
-@pytest.fixture
+@pytest.fixture(scope="session", autouse=True)
+def patch_init_database(request):
+    """Mock database initialization once for the session."""
+    patcher = patch('services.shared.database.init_database')
+    mock_init = patcher.start()
+    request.addfinalizer(patcher.stop)
+    mock_init.return_value = Mock()
+    return mock_init
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop when it is installed."""
+    if UVLOOP_AVAILABLE:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
 def deterministic_seed():
     """Provide a deterministic seed for testing."""
     return 12345
@@ -372,11 +494,11 @@ def deterministic_seed():
 @pytest.fixture
 def mock_determinism_manager(deterministic_seed):
     """Create a mock determinism manager."""
-    with patch('services.render_orchestrator.implementations.blender.determinism.DeterminismManager') as mock_dm:
-        mock_dm.return_value.get_current_seed.return_value = deterministic_seed
-        mock_dm.return_value.set_seed.return_value = None
-        mock_dm.return_value.random.return_value = 0.5  # Deterministic random value
-        yield mock_dm.return_value
+    return _mock(
+        get_current_seed=deterministic_seed,
+        set_seed=None,
+        random=0.5  # Deterministic random value
+    )
 
 
 # Test markers for different test categories
@@ -390,31 +512,49 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "slow: mark test as slow running")
 
 
+def pytest_collection_finish(session):
+    """Exclude the collected modules and items from future collections."""
+    gc.collect()
+    gc.freeze()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Release objects frozen by pytest_collection_finish."""
+    gc.unfreeze()
+    gc.collect()
+
+
 # Test collection hooks
+_CATEGORY_MARKS = {
+    "integration": (pytest.mark.integration,),
+    "determinism": (pytest.mark.determinism,),
+    "compliance": (pytest.mark.compliance,),
+    "performance": (pytest.mark.performance, pytest.mark.slow),
+    "e2e": (pytest.mark.e2e, pytest.mark.slow),
+}
+_TESTS_DIR = Path(__file__).parent
+
+
 def pytest_collection_modifyitems(config, items):
     """Modify test collection to add markers based on test location."""
     for item in items:
-        # Add markers based on test file location
-        if "integration" in str(item.fspath):
-            item.add_marker(pytest.mark.integration)
-        elif "determinism" in str(item.fspath):
-            item.add_marker(pytest.mark.determinism)
-        elif "compliance" in str(item.fspath):
-            item.add_marker(pytest.mark.compliance)
-        elif "performance" in str(item.fspath):
-            item.add_marker(pytest.mark.performance)
-            item.add_marker(pytest.mark.slow)
-        elif "e2e" in str(item.fspath):
-            item.add_marker(pytest.mark.e2e)
-            item.add_marker(pytest.mark.slow)
-
-
-# Test reporting
+        # Add markers based on the category directory directly under tests/
+        try:
+            category = item.path.relative_to(_TESTS_DIR).parts[0]
+        except ValueError:
+            continue
+        for mark in _CATEGORY_MARKS.get(category, ()):
+            item.add_marker(mark)
+
+
+# Test reporting; the hooks only fire when pytest-html is installed
+@pytest.hookimpl(optionalhook=True)
 def pytest_html_report_title(report):
     """Set the title of the HTML report."""
     report.title = "Legal Simulation Platform Test Report"
 
 
+@pytest.hookimpl(optionalhook=True)
 def pytest_html_results_summary(prefix, summary, postfix):
     """Add custom summary to HTML report."""
     prefix.extend([
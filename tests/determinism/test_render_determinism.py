@@ -6,36 +6,134 @@ to ensure frame-perfect reproducibility for legal evidence.
 
 import pytest
 import asyncio
-import tempfile
+import functools
 import hashlib
 import json
+from dataclasses import dataclass
 from pathlib import Path
-from unittest.mock import Mock, patch
+from typing import Dict, Tuple
+from unittest.mock import patch
 import numpy as np
 
-# Import render services
-from services.render-orchestrator.implementations.blender.local_renderer import BlenderLocalRenderer
-from services.render_orchestrator.implementations.blender.profiles.neutral import NeutralProfile
-from services.render_orchestrator.implementations.blender.profiles.cinematic import CinematicProfile
+from tests.json_helpers import dumps, dumps_indented
+
+# Import render services; the renderer itself is only patched by dotted path
 from services.render_orchestrator.implementations.blender.determinism import DeterminismManager
-from services.timeline-compiler.scene_graph.usd_builder import USDBuilder
-from services.shared.models.render import RenderJob, RenderQuality
+
+# Seeds with golden test cases, one parametrized test per seed
+GOLDEN_TEST_SEEDS = [11111, 22222, 33333]
+
+# Determinism suite cases, one parametrized test per case
+SUITE_TEST_CASES = [
+    {"seed": 111, "scene_type": "simple", "duration": 2.0},
+    {"seed": 222, "scene_type": "medium", "duration": 3.0},
+    {"seed": 333, "scene_type": "complex", "duration": 5.0}
+]
+
+# Scene complexity levels checked for determinism
+SCENE_COMPLEXITIES = {
+    "simple": {
+        "objects": 1,
+        "lights": 1,
+        "materials": 1,
+        "expected_consistency": 1.0
+    },
+    "medium": {
+        "objects": 5,
+        "lights": 3,
+        "materials": 4,
+        "expected_consistency": 0.99
+    },
+    "complex": {
+        "objects": 20,
+        "lights": 8,
+        "materials": 15,
+        "expected_consistency": 0.98
+    }
+}
+
+
+def _build_scene(name: str, complexity: dict) -> dict:
+    """Build scene data with the object and light counts of a complexity level."""
+    return {
+        "scene_id": f"complexity_test_{name}",
+        "duration": 3.0,
+        "fps": 24,
+        "resolution": {"width": 1280, "height": 720},
+        "objects": [
+            {
+                "id": f"obj_{i}",
+                "type": "cube",
+                "position": [i * 2, 0, 0],
+                "material": {"color": [0.1 * i, 0.5, 0.8]}
+            }
+            for i in range(complexity["objects"])
+        ],
+        "lighting": [
+            {
+                "type": "sun",
+                "position": [i * 3, 5, 10],
+                "energy": 2.0 + i * 0.5
+            }
+            for i in range(complexity["lights"])
+        ]
+    }
+
+
+# Scenes are built once at import and shared (read-only) by every run
+_SCENES = {name: _build_scene(name, cfg) for name, cfg in SCENE_COMPLEXITIES.items()}
+
+
+@dataclass
+class _RenderResultStub:
+    """Plain render result returned by the mocked renderer."""
+    checksums: Dict[str, str]
+    output_path: str = ""
+    frames_generated: int = 0
+
+
+@functools.lru_cache(maxsize=None)
+def _mock_checksums(prefix: str, frame_count: int) -> tuple:
+    """Frame checksum items ``(frame_NNN, <prefix>NNN)`` for frames 1..frame_count."""
+    return tuple(
+        (f"frame_{i:03d}", f"{prefix}{i:03d}") for i in range(1, frame_count + 1)
+    )
+
+
+def _random_bytes(manager, count: int) -> bytes:
+    """Raw float64 bytes of ``count`` draws from the manager's seeded generator."""
+    return np.fromiter((manager.random() for _ in range(count)), dtype=np.float64, count=count).tobytes()
 
 
 class TestRenderDeterminism:
     """Test suite for rendering determinism and reproducibility."""
     
-    @pytest.fixture
-    def temp_dir(self):
-        """Create temporary directory for test files."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            yield Path(tmp_dir)
+    @pytest.fixture(scope="session")
+    def session_temp_dir(self, tmp_path_factory):
+        """Create one temporary directory shared by the determinism tests."""
+        return tmp_path_factory.mktemp("determinism")
     
     @pytest.fixture
+    def temp_dir(self, session_temp_dir, request):
+        """Give each test its own subdirectory of the shared temporary directory."""
+        test_dir = session_temp_dir / request.node.name
+        test_dir.mkdir(exist_ok=True)
+        return test_dir
+    
+    @pytest.fixture(scope="module")
     def determinism_manager(self):
-        """Create determinism manager for testing."""
+        """Create determinism manager shared by the module's tests.
+        
+        Every test that uses it sets its own seed first.
+        """
         return DeterminismManager()
     
+    @pytest.fixture
+    def mock_renderer(self):
+        """Patch the Blender renderer once for the duration of a test."""
+        with patch('services.render_orchestrator.implementations.blender.local_renderer.BlenderLocalRenderer') as renderer_cls:
+            yield renderer_cls
+    
     @pytest.fixture
     def test_scene_data(self):
         """Create test scene data for rendering."""
@@ -73,8 +171,12 @@ class TestRenderDeterminism:
             ]
         }
     
-    def create_golden_test_case(self, temp_dir: Path, scene_data: dict, seed: int) -> Path:
-        """Create a golden test case for determinism verification."""
+    def create_golden_test_case(self, temp_dir: Path, scene_data: dict, seed: int) -> Tuple[Path, dict]:
+        """Create a golden test case for determinism verification.
+        
+        Returns the golden file path along with the case it was written from,
+        so callers need not read the file back.
+        """
         golden_file = temp_dir / f"golden_test_seed_{seed}.json"
         
         # Create deterministic scene data
@@ -93,42 +195,41 @@ class TestRenderDeterminism:
             }
         }
         
-        golden_file.write_text(json.dumps(deterministic_scene, indent=2))
-        return golden_file
+        golden_file.write_bytes(dumps_indented(deterministic_scene))
+        return golden_file, deterministic_scene
     
     @pytest.mark.asyncio
-    async def test_render_reproducibility_across_runs(self, temp_dir, determinism_manager, test_scene_data):
+    async def test_render_reproducibility_across_runs(self, temp_dir, determinism_manager, test_scene_data, mock_renderer):
         """Test that identical renders produce identical outputs."""
         seed = 12345
         num_runs = 3
         
-        # Mock renderer to return consistent results
-        with patch('services.render_orchestrator.implementations.blender.local_renderer.BlenderLocalRenderer') as mock_renderer:
-            # Create mock render results with deterministic content
-            mock_result = Mock()
-            mock_result.output_path = str(temp_dir / "render_output.mp4")
-            mock_result.frames_generated = 120  # 5 seconds * 24 fps
-            mock_result.checksums = {
-                f"frame_{i:03d}": f"deterministic_hash_{i:03d}" for i in range(1, 121)
-            }
-            mock_renderer.return_value.render.return_value = mock_result
-            
-            renderer = mock_renderer.return_value
-            checksums = []
-            
-            # Run multiple renders with same seed
-            for run in range(num_runs):
-                determinism_manager.set_seed(seed)
-                result = renderer.render(
-                    scene_data=test_scene_data,
-                    output_path=temp_dir / f"render_run_{run}.mp4",
-                    profile="neutral"
-                )
-                checksums.append(result.checksums)
-            
-            # Verify all runs produced identical results
-            for i in range(1, num_runs):
-                assert checksums[0] == checksums[i], f"Run {i} produced different checksums than run 0"
+        # Mock renderer to return consistent results with deterministic content
+        mock_result = _RenderResultStub(
+            checksums=dict(_mock_checksums("deterministic_hash_", 120)),
+            output_path=str(temp_dir / "render_output.mp4"),
+            frames_generated=120  # 5 seconds * 24 fps
+        )
+        mock_renderer.return_value.render.return_value = mock_result
+        
+        renderer = mock_renderer.return_value
+        checksums = []
+        
+        # Run multiple renders with same seed
+        for run in range(num_runs):
+            determinism_manager.set_seed(seed)
+            result = renderer.render(
+                scene_data=test_scene_data,
+                output_path=temp_dir / f"render_run_{run}.mp4",
+                profile="neutral"
+            )
+            checksums.append(result.checksums)
+        
+        # Verify all runs produced identical results; the identity check skips
+        # the dict walk when the renderer hands back the same object
+        base = checksums[0]
+        assert all(c is base or c == base for c in checksums[1:]), \
+            "Runs produced different checksums than run 0"
     
     @pytest.mark.asyncio
     async def test_seed_propagation_through_pipeline(self, temp_dir, determinism_manager):
@@ -142,250 +243,166 @@ class TestRenderDeterminism:
         
         # Test seed affects random operations
         determinism_manager.set_seed(seed)
-        random_values_1 = [determinism_manager.random() for _ in range(10)]
+        random_bytes_1 = _random_bytes(determinism_manager, 10)
         
         determinism_manager.set_seed(seed)
-        random_values_2 = [determinism_manager.random() for _ in range(10)]
+        random_bytes_2 = _random_bytes(determinism_manager, 10)
         
-        # Same seed should produce same random values
-        assert random_values_1 == random_values_2
+        # Same seed should produce the same byte stream, down to the
+        # floating-point representation
+        assert random_bytes_1 == random_bytes_2
         
         # Different seed should produce different values
         determinism_manager.set_seed(seed + 1)
-        random_values_3 = [determinism_manager.random() for _ in range(10)]
-        assert random_values_1 != random_values_3
+        random_bytes_3 = _random_bytes(determinism_manager, 10)
+        assert random_bytes_1 != random_bytes_3
     
     @pytest.mark.asyncio
-    async def test_checksum_consistency(self, temp_dir, test_scene_data):
+    async def test_checksum_consistency(self, temp_dir, test_scene_data, mock_renderer):
         """Test that frame checksums are consistent across renders."""
         seed = 98765
         
         # Create test frame data
-        frame_data = np.random.RandomState(seed).randint(0, 255, (1080, 1920, 3), dtype=np.uint8)
-        frame_path = temp_dir / "test_frame.png"
+        frame_data = np.random.default_rng(seed).integers(0, 256, (1080, 1920, 3), dtype=np.uint8)
         
-        # Save frame and calculate checksum
-        from PIL import Image
-        Image.fromarray(frame_data).save(frame_path)
+        # Hash the raw frame buffer directly; encoding it to PNG first only
+        # adds a deflate pass and a file round-trip
+        frame_checksum = hashlib.sha256(memoryview(frame_data.reshape(-1))).hexdigest()
         
-        # Calculate checksum multiple times
-        checksums = []
-        for _ in range(5):
-            with open(frame_path, 'rb') as f:
-                content = f.read()
-                checksum = hashlib.sha256(content).hexdigest()
-                checksums.append(checksum)
+        # Test deterministic frame generation
+        mock_result = _RenderResultStub(checksums={"frame_001": frame_checksum})
+        mock_renderer.return_value.render.return_value = mock_result
         
-        # All checksums should be identical
-        assert all(c == checksums[0] for c in checksums), "Checksums should be consistent"
+        renderer = mock_renderer.return_value
         
-        # Test deterministic frame generation
-        with patch('services.render_orchestrator.implementations.blender.local_renderer.BlenderLocalRenderer') as mock_renderer:
-            mock_result = Mock()
-            mock_result.checksums = {"frame_001": hashlib.sha256(frame_data.tobytes()).hexdigest()}
-            mock_renderer.return_value.render.return_value = mock_result
-            
-            renderer = mock_renderer.return_value
-            
-            # Generate frame with same parameters multiple times
-            frame_checksums = []
-            for _ in range(3):
-                result = renderer.render(
-                    scene_data={"duration": 1.0},
-                    output_path=temp_dir / "test_frame.mp4",
-                    profile="neutral",
-                    seed=seed
-                )
-                frame_checksums.append(result.checksums["frame_001"])
-            
-            # All generated frames should have same checksum
-            assert all(c == frame_checksums[0] for c in frame_checksums)
+        # Generate frame with same parameters multiple times
+        frame_checksums = []
+        for _ in range(3):
+            result = renderer.render(
+                scene_data={"duration": 1.0},
+                output_path=temp_dir / "test_frame.mp4",
+                profile="neutral",
+                seed=seed
+            )
+            frame_checksums.append(result.checksums["frame_001"])
+        
+        # All generated frames should have same checksum
+        assert all(c == frame_checksum for c in frame_checksums)
     
     @pytest.mark.asyncio
-    async def test_golden_test_cases(self, temp_dir, test_scene_data):
+    @pytest.mark.parametrize("seed", GOLDEN_TEST_SEEDS)
+    async def test_golden_test_cases(self, temp_dir, test_scene_data, mock_renderer, seed):
         """Test against golden test cases for regression detection."""
-        test_seeds = [11111, 22222, 33333]
-        
-        # Create golden test cases
-        golden_cases = {}
-        for seed in test_seeds:
-            golden_file = self.create_golden_test_case(temp_dir, test_scene_data, seed)
-            golden_cases[seed] = json.loads(golden_file.read_text())
-        
-        # Test rendering against golden cases
-        with patch('services.render_orchestrator.implementations.blender.local_renderer.BlenderLocalRenderer') as mock_renderer:
-            for seed, golden_case in golden_cases.items():
-                # Mock renderer to return expected checksums
-                mock_result = Mock()
-                mock_result.checksums = golden_case["expected_checksums"]
-                mock_renderer.return_value.render.return_value = mock_result
-                
-                renderer = mock_renderer.return_value
-                
-                # Render with same seed as golden case
-                result = renderer.render(
-                    scene_data=test_scene_data,
-                    output_path=temp_dir / f"test_seed_{seed}.mp4",
-                    profile="neutral",
-                    seed=seed
-                )
-                
-                # Verify checksums match golden case
-                assert result.checksums == golden_case["expected_checksums"], \
-                    f"Checksums for seed {seed} don't match golden case"
+        # Create golden test case
+        _, golden_case = self.create_golden_test_case(temp_dir, test_scene_data, seed)
+        
+        # Test rendering against golden case
+        # Mock renderer to return expected checksums
+        mock_result = _RenderResultStub(checksums=golden_case["expected_checksums"])
+        mock_renderer.return_value.render.return_value = mock_result
+        
+        renderer = mock_renderer.return_value
+        
+        # Render with same seed as golden case
+        result = renderer.render(
+            scene_data=test_scene_data,
+            output_path=temp_dir / f"test_seed_{seed}.mp4",
+            profile="neutral",
+            seed=seed
+        )
+        
+        # Verify checksums match golden case
+        assert result.checksums == golden_case["expected_checksums"], \
+            f"Checksums for seed {seed} don't match golden case"
     
     @pytest.mark.asyncio
-    async def test_determinism_with_various_scene_complexities(self, temp_dir):
+    @pytest.mark.parametrize("complexity,scene_data", list(_SCENES.items()), ids=list(_SCENES))
+    async def test_determinism_with_various_scene_complexities(self, temp_dir, mock_renderer, complexity, scene_data):
         """Test determinism with scenes of varying complexity."""
-        scene_complexities = [
-            {
-                "name": "simple",
-                "objects": 1,
-                "lights": 1,
-                "materials": 1,
-                "expected_consistency": 1.0
-            },
-            {
-                "name": "medium",
-                "objects": 5,
-                "lights": 3,
-                "materials": 4,
-                "expected_consistency": 0.99
-            },
-            {
-                "name": "complex",
-                "objects": 20,
-                "lights": 8,
-                "materials": 15,
-                "expected_consistency": 0.98
-            }
-        ]
-        
         seed = 45678
+        expected_consistency = SCENE_COMPLEXITIES[complexity]["expected_consistency"]
         
-        for complexity in scene_complexities:
-            # Create scene with specified complexity
-            scene_data = {
-                "scene_id": f"complexity_test_{complexity['name']}",
-                "duration": 3.0,
-                "fps": 24,
-                "resolution": {"width": 1280, "height": 720},
-                "objects": [
-                    {
-                        "id": f"obj_{i}",
-                        "type": "cube",
-                        "position": [i * 2, 0, 0],
-                        "material": {"color": [0.1 * i, 0.5, 0.8]}
-                    }
-                    for i in range(complexity["objects"])
-                ],
-                "lighting": [
-                    {
-                        "type": "sun",
-                        "position": [i * 3, 5, 10],
-                        "energy": 2.0 + i * 0.5
-                    }
-                    for i in range(complexity["lights"])
-                ]
-            }
-            
-            # Test determinism with this complexity
-            with patch('services.render_orchestrator.implementations.blender.local_renderer.BlenderLocalRenderer') as mock_renderer:
-                # Mock deterministic results
-                mock_result = Mock()
-                mock_result.checksums = {
-                    f"frame_{i:03d}": f"deterministic_{complexity['name']}_{i:03d}"
-                    for i in range(1, 73)  # 3 seconds * 24 fps
-                }
-                mock_renderer.return_value.render.return_value = mock_result
-                
-                renderer = mock_renderer.return_value
-                
-                # Run two identical renders
-                results = []
-                for run in range(2):
-                    result = renderer.render(
-                        scene_data=scene_data,
-                        output_path=temp_dir / f"{complexity['name']}_run_{run}.mp4",
-                        profile="neutral",
-                        seed=seed
-                    )
-                    results.append(result.checksums)
-                
-                # Verify consistency meets expected threshold
-                consistency = len(set(tuple(r.items()) for r in results)) == 1
-                assert consistency >= complexity["expected_consistency"], \
-                    f"Complexity {complexity['name']} failed determinism test"
+        # Mock deterministic results for this complexity
+        mock_result = _RenderResultStub(
+            checksums=dict(_mock_checksums(f"deterministic_{complexity}_", 72)),
+            frames_generated=72  # 3 seconds * 24 fps
+        )
+        mock_renderer.return_value.render.return_value = mock_result
+        
+        renderer = mock_renderer.return_value
+        
+        # Run two identical renders
+        results = []
+        for run in range(2):
+            result = renderer.render(
+                scene_data=scene_data,
+                output_path=temp_dir / f"{complexity}_run_{run}.mp4",
+                profile="neutral",
+                seed=seed
+            )
+            results.append(result.checksums)
+        
+        # Verify consistency meets expected threshold
+        consistency = 1.0 if results[0] == results[1] else 0.0
+        assert consistency >= expected_consistency, \
+            f"Complexity {complexity} failed determinism test"
     
     @pytest.mark.asyncio
-    async def test_determinism_test_suite(self, temp_dir, determinism_manager):
+    @pytest.mark.parametrize("suite_case", SUITE_TEST_CASES, ids=lambda case: case["scene_type"])
+    async def test_determinism_test_suite(self, temp_dir, determinism_manager, mock_renderer, suite_case):
         """Test the determinism test suite itself."""
-        # Create test suite configuration
-        test_config = {
-            "test_cases": [
-                {"seed": 111, "scene_type": "simple", "duration": 2.0},
-                {"seed": 222, "scene_type": "medium", "duration": 3.0},
-                {"seed": 333, "scene_type": "complex", "duration": 5.0}
-            ],
-            "tolerance": 0.001,  # Allow for minor floating point differences
-            "max_retries": 3
-        }
+        seed = suite_case["seed"]
+        determinism_manager.set_seed(seed)
         
-        # Run determinism test suite
-        results = []
-        for test_case in test_config["test_cases"]:
-            seed = test_case["seed"]
-            determinism_manager.set_seed(seed)
-            
-            # Simulate render with this seed
-            with patch('services.render_orchestrator.implementations.blender.local_renderer.BlenderLocalRenderer') as mock_renderer:
-                mock_result = Mock()
-                mock_result.checksums = {
-                    f"frame_{i:03d}": f"test_suite_hash_{seed}_{i:03d}"
-                    for i in range(1, int(test_case["duration"] * 24) + 1)
-                }
-                mock_renderer.return_value.render.return_value = mock_result
-                
-                renderer = mock_renderer.return_value
-                
-                # Run multiple times to test consistency
-                run_results = []
-                for run in range(3):
-                    result = renderer.render(
-                        scene_data={"duration": test_case["duration"]},
-                        output_path=temp_dir / f"suite_test_{seed}_run_{run}.mp4",
-                        profile="neutral",
-                        seed=seed
-                    )
-                    run_results.append(result.checksums)
-                
-                # Check consistency
-                is_consistent = all(
-                    r == run_results[0] for r in run_results[1:]
+        # Simulate render with this seed
+        frame_count = int(suite_case["duration"] * 24)
+        mock_result = _RenderResultStub(
+            checksums=dict(_mock_checksums(f"test_suite_hash_{seed}_", frame_count)),
+            frames_generated=frame_count
+        )
+        mock_renderer.return_value.render.return_value = mock_result
+        
+        renderer = mock_renderer.return_value
+        
+        # Run multiple times concurrently to test consistency
+        run_results = [
+            result.checksums
+            for result in await asyncio.gather(*[
+                asyncio.to_thread(
+                    renderer.render,
+                    scene_data={"duration": suite_case["duration"]},
+                    output_path=temp_dir / f"suite_test_{seed}_run_{run}.mp4",
+                    profile="neutral",
+                    seed=seed
                 )
-                
-                results.append({
-                    "seed": seed,
-                    "scene_type": test_case["scene_type"],
-                    "consistent": is_consistent,
-                    "checksums": run_results[0]
-                })
-        
-        # Verify all test cases passed
-        for result in results:
-            assert result["consistent"], f"Test case {result['seed']} failed determinism"
+                for run in range(3)
+            ])
+        ]
+        
+        # Check consistency
+        is_consistent = all(
+            r == run_results[0] for r in run_results[1:]
+        )
+        
+        result = {
+            "seed": seed,
+            "scene_type": suite_case["scene_type"],
+            "consistent": is_consistent,
+            "checksums": run_results[0]
+        }
+        assert result["consistent"], f"Test case {seed} failed determinism"
         
         # Generate determinism report
         report = {
-            "total_tests": len(results),
-            "passed_tests": sum(1 for r in results if r["consistent"]),
-            "failed_tests": sum(1 for r in results if not r["consistent"]),
-            "test_results": results
+            "total_tests": 1,
+            "passed_tests": int(is_consistent),
+            "failed_tests": int(not is_consistent),
+            "test_results": [result]
         }
         
         # Save report
-        report_path = temp_dir / "determinism_report.json"
-        report_path.write_text(json.dumps(report, indent=2))
+        report_path = temp_dir / f"determinism_report_{seed}.json"
+        report_path.write_bytes(dumps(report))
         
         assert report["failed_tests"] == 0, "Some determinism tests failed"
         assert report["passed_tests"] == report["total_tests"], "Not all tests passed"
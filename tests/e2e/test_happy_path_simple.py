@@ -8,18 +8,30 @@ import pytest
 import asyncio
 import httpx
 import json
+import random
 import time
 import tempfile
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+# Seconds a successful service health check is reused before probing again
+HEALTH_CACHE_TTL = 5.0
+
 
 class PollingHelper:
-    """Helper class for polling operations with timeout."""
+    """Helper class for polling operations with timeout.
+    
+    Checks back off exponentially from ``base`` seconds up to ``interval``
+    seconds between attempts, with +/- ``jitter`` applied to every delay so
+    concurrent pollers do not probe in lockstep.
+    """
     
-    def __init__(self, timeout: float = 60.0, interval: float = 2.0):
+    def __init__(self, timeout: float = 60.0, interval: float = 2.0,
+                 base: float = 0.25, jitter: float = 0.2):
         self.timeout = timeout
         self.interval = interval
+        self.base = base
+        self.jitter = jitter
     
     async def poll_until(self, check_func, *args, **kwargs) -> Any:
         """
@@ -35,9 +47,10 @@ class PollingHelper:
         Raises:
             TimeoutError: If timeout is reached without condition being met
         """
-        start_time = time.time()
+        start_time = time.monotonic()
+        attempt = 0
         
-        while time.time() - start_time < self.timeout:
+        while time.monotonic() - start_time < self.timeout:
             try:
                 result = await check_func(*args, **kwargs)
                 if result:
@@ -45,7 +58,9 @@ class PollingHelper:
             except Exception as e:
                 print(f"Polling check failed: {e}")
             
-            await asyncio.sleep(self.interval)
+            delay = min(self.interval, self.base * (2 ** attempt))
+            await asyncio.sleep(delay * random.uniform(1 - self.jitter, 1 + self.jitter))
+            attempt += 1
         
         raise TimeoutError(f"Polling timeout after {self.timeout} seconds")
 
@@ -63,30 +78,63 @@ class SimpleE2ETest:
         }
         self.polling_helper = PollingHelper(timeout=120.0, interval=3.0)
         self.test_data = {}
+        self._client: Optional[httpx.AsyncClient] = None
+        # base_url -> monotonic time the service was last seen healthy
+        self._health_cache: Dict[str, float] = {}
+    
+    async def __aenter__(self) -> "SimpleE2ETest":
+        """Open the HTTP client shared by every probe of the test run."""
+        self._client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=15.0)
+        )
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Close the shared HTTP client."""
+        await self._client.aclose()
+        self._client = None
     
     async def check_service_health(self, service_name: str, base_url: str) -> bool:
-        """Check if a service is healthy."""
+        """Check if a service is healthy.
+        
+        A healthy result is trusted for HEALTH_CACHE_TTL seconds; unhealthy
+        results are never cached so a service coming up is noticed at once.
+        """
+        checked_at = self._health_cache.get(base_url)
+        if checked_at is not None and time.monotonic() - checked_at < HEALTH_CACHE_TTL:
+            return True
+        
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{base_url}/health")
-                return response.status_code == 200
+            response = await self._client.get(f"{base_url}/health", timeout=5.0)
         except Exception:
             return False
+        
+        healthy = response.status_code == 200
+        if healthy:
+            self._health_cache[base_url] = time.monotonic()
+        return healthy
     
     async def wait_for_services(self) -> bool:
         """Wait for all services to be healthy."""
         print("🔍 Waiting for services to be healthy...")
         
-        healthy_services = 0
-        for service_name, base_url in self.base_urls.items():
+        async def probe(service_name: str, base_url: str) -> bool:
             try:
-                result = await self.polling_helper.poll_until(
+                await self.polling_helper.poll_until(
                     self.check_service_health, service_name, base_url
                 )
                 print(f"✅ {service_name}: Healthy")
-                healthy_services += 1
+                return True
             except TimeoutError:
                 print(f"❌ {service_name}: Not responding")
+                return False
+        
+        # Services warm up independently, so wait on all of them at once
+        results = await asyncio.gather(
+            *(probe(service_name, base_url) for service_name, base_url in self.base_urls.items())
+        )
+        healthy_services = sum(results)
         
         print(f"📊 Services healthy: {healthy_services}/{len(self.base_urls)}")
         return healthy_services > 0  # At least one service should be healthy
@@ -95,17 +143,22 @@ class SimpleE2ETest:
         """Test API Gateway health endpoint."""
         print("🏥 Testing API Gateway health...")
         
+        # wait_for_services has usually just seen the gateway healthy
+        checked_at = self._health_cache.get(self.base_urls["api_gateway"])
+        if checked_at is not None and time.monotonic() - checked_at < HEALTH_CACHE_TTL:
+            print("✅ API Gateway healthy (cached)")
+            return True
+        
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self.base_urls['api_gateway']}/health")
-                
-                if response.status_code == 200:
-                    health_data = response.json()
-                    print(f"✅ API Gateway healthy: {health_data}")
-                    return True
-                else:
-                    print(f"❌ API Gateway unhealthy: {response.status_code}")
-                    return False
+            response = await self._client.get(f"{self.base_urls['api_gateway']}/health", timeout=5.0)
+            
+            if response.status_code == 200:
+                health_data = response.json()
+                print(f"✅ API Gateway healthy: {health_data}")
+                return True
+            else:
+                print(f"❌ API Gateway unhealthy: {response.status_code}")
+                return False
         except Exception as e:
             print(f"❌ API Gateway health check failed: {e}")
             return False
@@ -115,20 +168,19 @@ class SimpleE2ETest:
         print("🔍 Testing API Gateway readiness...")
         
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self.base_urls['api_gateway']}/ready")
-                
-                if response.status_code == 200:
-                    readiness_data = response.json()
-                    print(f"✅ API Gateway ready: {readiness_data}")
-                    return True
-                elif response.status_code == 503:
-                    readiness_data = response.json()
-                    print(f"⚠️ API Gateway not ready (expected): {readiness_data}")
-                    return True  # 503 is expected if dependencies are down
-                else:
-                    print(f"❌ API Gateway readiness check failed: {response.status_code}")
-                    return False
+            response = await self._client.get(f"{self.base_urls['api_gateway']}/ready", timeout=5.0)
+            
+            if response.status_code == 200:
+                readiness_data = response.json()
+                print(f"✅ API Gateway ready: {readiness_data}")
+                return True
+            elif response.status_code == 503:
+                readiness_data = response.json()
+                print(f"⚠️ API Gateway not ready (expected): {readiness_data}")
+                return True  # 503 is expected if dependencies are down
+            else:
+                print(f"❌ API Gateway readiness check failed: {response.status_code}")
+                return False
         except Exception as e:
             print(f"❌ API Gateway readiness check failed: {e}")
             return False
@@ -148,12 +200,11 @@ class SimpleE2ETest:
                     files = {"file": ("test_evidence.txt", f, "text/plain")}
                     data = {"case_id": "test-case-123", "description": "E2E test evidence"}
                     
-                    async with httpx.AsyncClient(timeout=10.0) as client:
-                        response = await client.post(
-                            f"{self.base_urls['api_gateway']}/api/v1/evidence/upload",
-                            files=files,
-                            data=data
-                        )
+                    response = await self._client.post(
+                        f"{self.base_urls['api_gateway']}/api/v1/evidence/upload",
+                        files=files,
+                        data=data
+                    )
                 
                 if response.status_code in [200, 201, 400, 422]:  # Accept various responses
                     print(f"✅ Evidence upload endpoint responding: {response.status_code}")
@@ -189,11 +240,10 @@ class SimpleE2ETest:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(
-                    f"{self.base_urls['api_gateway']}/api/v1/storyboards",
-                    json=storyboard_data
-                )
+            response = await self._client.post(
+                f"{self.base_urls['api_gateway']}/api/v1/storyboards",
+                json=storyboard_data
+            )
             
             if response.status_code in [200, 201, 400, 422]:  # Accept various responses
                 print(f"✅ Storyboard creation endpoint responding: {response.status_code}")
@@ -211,10 +261,9 @@ class SimpleE2ETest:
         print("⏱️ Testing timeline compilation endpoint...")
         
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(
-                    f"{self.base_urls['api_gateway']}/api/v1/storyboards/test-storyboard-123/compile"
-                )
+            response = await self._client.post(
+                f"{self.base_urls['api_gateway']}/api/v1/storyboards/test-storyboard-123/compile"
+            )
             
             if response.status_code in [200, 202, 400, 404, 422]:  # Accept various responses
                 print(f"✅ Timeline compilation endpoint responding: {response.status_code}")
@@ -247,11 +296,10 @@ class SimpleE2ETest:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(
-                    f"{self.base_urls['api_gateway']}/api/v1/renders",
-                    json=render_data
-                )
+            response = await self._client.post(
+                f"{self.base_urls['api_gateway']}/api/v1/renders",
+                json=render_data
+            )
             
             if response.status_code in [200, 202, 400, 404, 422]:  # Accept various responses
                 print(f"✅ Render endpoint responding: {response.status_code}")
@@ -266,89 +314,67 @@ class SimpleE2ETest:
     
     async def run_simple_e2e_test(self) -> Dict[str, Any]:
         """Run the simple E2E test."""
-        print("🚀 Starting Simple E2E Test")
-        print("=" * 50)
-        
-        test_results = {
-            "success": True,
-            "tests_passed": 0,
-            "tests_total": 0,
-            "results": {}
-        }
-        
-        try:
-            # Test 1: Wait for services
-            test_results["tests_total"] += 1
-            services_healthy = await self.wait_for_services()
-            test_results["results"]["services_healthy"] = services_healthy
-            if services_healthy:
-                test_results["tests_passed"] += 1
-            
-            # Test 2: API Gateway health
-            test_results["tests_total"] += 1
-            api_health = await self.test_api_gateway_health()
-            test_results["results"]["api_health"] = api_health
-            if api_health:
-                test_results["tests_passed"] += 1
-            
-            # Test 3: API Gateway readiness
-            test_results["tests_total"] += 1
-            api_readiness = await self.test_api_gateway_readiness()
-            test_results["results"]["api_readiness"] = api_readiness
-            if api_readiness:
-                test_results["tests_passed"] += 1
-            
-            # Test 4: Evidence upload endpoint
-            test_results["tests_total"] += 1
-            evidence_upload = await self.test_evidence_upload_endpoint()
-            test_results["results"]["evidence_upload"] = evidence_upload
-            if evidence_upload:
-                test_results["tests_passed"] += 1
-            
-            # Test 5: Storyboard creation endpoint
-            test_results["tests_total"] += 1
-            storyboard_creation = await self.test_storyboard_creation_endpoint()
-            test_results["results"]["storyboard_creation"] = storyboard_creation
-            if storyboard_creation:
-                test_results["tests_passed"] += 1
-            
-            # Test 6: Timeline compilation endpoint
-            test_results["tests_total"] += 1
-            timeline_compilation = await self.test_timeline_compilation_endpoint()
-            test_results["results"]["timeline_compilation"] = timeline_compilation
-            if timeline_compilation:
-                test_results["tests_passed"] += 1
-            
-            # Test 7: Render endpoint
-            test_results["tests_total"] += 1
-            render_endpoint = await self.test_render_endpoint()
-            test_results["results"]["render_endpoint"] = render_endpoint
-            if render_endpoint:
-                test_results["tests_passed"] += 1
-            
-            # Calculate success rate
-            success_rate = (test_results["tests_passed"] / test_results["tests_total"]) * 100
-            
-            print(f"\n📊 E2E Test Results")
+        async with self:
+            print("🚀 Starting Simple E2E Test")
             print("=" * 50)
-            print(f"Tests passed: {test_results['tests_passed']}/{test_results['tests_total']}")
-            print(f"Success rate: {success_rate:.1f}%")
-            print(f"Results: {test_results['results']}")
             
-            if success_rate >= 70:  # At least 70% of tests should pass
-                print("🎉 E2E Test Completed Successfully!")
-                test_results["success"] = True
-            else:
-                print("❌ E2E Test Failed - Success rate too low")
-                test_results["success"] = False
-            
-            return test_results
+            test_results = {
+                "success": True,
+                "tests_passed": 0,
+                "tests_total": 0,
+                "results": {}
+            }
             
-        except Exception as e:
-            print(f"\n❌ E2E Test Failed with Exception: {e}")
-            test_results["success"] = False
-            test_results["error"] = str(e)
-            return test_results
+            try:
+                # Test 1: Wait for services
+                test_results["tests_total"] += 1
+                services_healthy = await self.wait_for_services()
+                test_results["results"]["services_healthy"] = services_healthy
+                if services_healthy:
+                    test_results["tests_passed"] += 1
+                
+                # Tests 2-7: the endpoint probes are independent, so run them together
+                probes = [
+                    ("api_health", self.test_api_gateway_health()),
+                    ("api_readiness", self.test_api_gateway_readiness()),
+                    ("evidence_upload", self.test_evidence_upload_endpoint()),
+                    ("storyboard_creation", self.test_storyboard_creation_endpoint()),
+                    ("timeline_compilation", self.test_timeline_compilation_endpoint()),
+                    ("render_endpoint", self.test_render_endpoint()),
+                ]
+                results = await asyncio.gather(
+                    *(probe for _, probe in probes), return_exceptions=True
+                )
+                for (name, _), result in zip(probes, results):
+                    passed = not isinstance(result, BaseException) and bool(result)
+                    test_results["tests_total"] += 1
+                    test_results["results"][name] = passed
+                    if passed:
+                        test_results["tests_passed"] += 1
+                
+                # Calculate success rate
+                success_rate = (test_results["tests_passed"] / test_results["tests_total"]) * 100
+                
+                print(f"\n📊 E2E Test Results")
+                print("=" * 50)
+                print(f"Tests passed: {test_results['tests_passed']}/{test_results['tests_total']}")
+                print(f"Success rate: {success_rate:.1f}%")
+                print(f"Results: {test_results['results']}")
+                
+                if success_rate >= 70:  # At least 70% of tests should pass
+                    print("🎉 E2E Test Completed Successfully!")
+                    test_results["success"] = True
+                else:
+                    print("❌ E2E Test Failed - Success rate too low")
+                    test_results["success"] = False
+                
+                return test_results
+                
+            except Exception as e:
+                print(f"\n❌ E2E Test Failed with Exception: {e}")
+                test_results["success"] = False
+                test_results["error"] = str(e)
+                return test_results
 
 
 @pytest.mark.asyncio
@@ -8,8 +8,12 @@ import pytest
 import asyncio
 import tempfile
 import os
+import functools
 import hashlib
+import io
+import threading
 from pathlib import Path
+from typing import Dict, Tuple
 from unittest.mock import Mock, patch
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
@@ -24,6 +28,73 @@ from services.shared.implementations.storage.local_storage import LocalStorage
 from services.shared.implementations.ocr.tesseract_local import TesseractLocalOCR
 from services.shared.implementations.asr.whisperx_local import WhisperXLocalASR
 
+_HASH_BUFSIZE = 1 << 20
+
+# (path, mtime_ns, size) -> hex digest; a rewritten file gets a new key
+_hash_cache: Dict[Tuple[Path, int, int], str] = {}
+
+
+def _sha256_path(path: Path) -> str:
+    """Hex SHA-256 of a file, streamed and memoized until the file changes."""
+    stat = path.stat()
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    cached = _hash_cache.get(key)
+    if cached is not None:
+        return cached
+    
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            digest = hashlib.file_digest(f, "sha256")
+        else:
+            digest = hashlib.sha256()
+            while chunk := f.read(_HASH_BUFSIZE):
+                digest.update(chunk)
+    
+    _hash_cache[key] = digest.hexdigest()
+    return _hash_cache[key]
+
+
+# FreeType faces are not safe to draw with from several threads at once
+_font_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _load_font() -> ImageFont.ImageFont:
+    """Font for test documents, loaded once per session."""
+    # Try to use a default font, fallback to basic if not available
+    try:
+        return ImageFont.truetype("arial.ttf", 24)
+    except OSError:
+        return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=None)
+def _document_png(text: str) -> bytes:
+    """PNG of a white page with ``text`` drawn on it, rendered once per text."""
+    # Create a white background image
+    img = Image.new('RGB', (800, 600), color='white')
+    draw = ImageDraw.Draw(img)
+    
+    # Draw text on the image
+    with _font_lock:
+        draw.text((50, 50), text, fill='black', font=_load_font())
+    
+    buffer = io.BytesIO()
+    img.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+@functools.lru_cache(maxsize=None)
+def _sine_pcm(duration: float, sample_rate: int, frequency: float = 440.0) -> bytes:
+    """16-bit mono PCM for a quiet sine tone, computed once per shape."""
+    samples = int(duration * sample_rate)
+    audio = np.sin(
+        np.linspace(0, 2 * np.pi * frequency * duration, samples, dtype=np.float32),
+        dtype=np.float32
+    )
+    audio *= 0.1 * 32767
+    return audio.astype(np.int16).tobytes()
+
 
 class TestEvidencePipeline:
     """Test suite for evidence processing pipeline integration."""
@@ -50,49 +121,26 @@ class TestEvidencePipeline:
             mode="DEMONSTRATIVE"
         )
     
-    def create_test_document_image(self, temp_dir: Path, text: str) -> Path:
+    def create_test_document_image(self, temp_dir: Path, text: str,
+                                   filename: str = "test_document.png") -> Path:
         """Create a test document image with specified text."""
-        # Create a white background image
-        img = Image.new('RGB', (800, 600), color='white')
-        draw = ImageDraw.Draw(img)
-        
-        # Try to use a default font, fallback to basic if not available
-        try:
-            font = ImageFont.truetype("arial.ttf", 24)
-        except OSError:
-            font = ImageFont.load_default()
-        
-        # Draw text on the image
-        draw.text((50, 50), text, fill='black', font=font)
-        
-        # Save the image
-        image_path = temp_dir / "test_document.png"
-        img.save(image_path)
+        image_path = temp_dir / filename
+        image_path.write_bytes(_document_png(text))
         return image_path
     
     def create_test_audio_file(self, temp_dir: Path, duration: float = 5.0) -> Path:
         """Create a test audio file with speech."""
         import wave
-        import numpy as np
         
         sample_rate = 16000
-        samples = int(duration * sample_rate)
-        
-        # Generate a simple sine wave as test audio
-        t = np.linspace(0, duration, samples)
-        frequency = 440  # A4 note
-        audio_data = np.sin(2 * np.pi * frequency * t) * 0.1
-        
-        # Convert to 16-bit PCM
-        audio_data = (audio_data * 32767).astype(np.int16)
         
-        # Save as WAV file
+        # Save an A4 sine tone as a WAV file
         audio_path = temp_dir / "test_audio.wav"
         with wave.open(str(audio_path), 'w') as wav_file:
             wav_file.setnchannels(1)  # Mono
             wav_file.setsampwidth(2)  # 16-bit
             wav_file.setframerate(sample_rate)
-            wav_file.writeframes(audio_data.tobytes())
+            wav_file.writeframes(_sine_pcm(duration, sample_rate))
         
         return audio_path
     
@@ -124,7 +172,7 @@ class TestEvidencePipeline:
             filename="test_document.png",
             evidence_type=EvidenceType.DOCUMENT,
             file_path=str(document_path),
-            sha256_hash=hashlib.sha256(document_path.read_bytes()).hexdigest(),
+            sha256_hash=_sha256_path(document_path),
             metadata={"original_text": test_text}
         )
         
@@ -159,7 +207,7 @@ class TestEvidencePipeline:
             filename="test_audio.wav",
             evidence_type=EvidenceType.AUDIO,
             file_path=str(audio_path),
-            sha256_hash=hashlib.sha256(audio_path.read_bytes()).hexdigest()
+            sha256_hash=_sha256_path(audio_path)
         )
         
         # Process audio through pipeline
@@ -188,7 +236,7 @@ class TestEvidencePipeline:
             filename="test_video.mp4",
             evidence_type=EvidenceType.VIDEO,
             file_path=str(video_path),
-            sha256_hash=hashlib.sha256(video_path.read_bytes()).hexdigest()
+            sha256_hash=_sha256_path(video_path)
         )
         
         # Process video through pipeline
@@ -332,26 +380,43 @@ class TestEvidencePipeline:
     @pytest.mark.asyncio
     async def test_concurrent_evidence_processing(self, temp_dir, storage_service, test_case):
         """Test processing multiple evidence items concurrently."""
-        # Create multiple test documents
-        evidence_items = []
-        for i in range(5):
-            text = f"Legal document {i} containing case information."
-            doc_path = self.create_test_document_image(temp_dir, text)
-            
-            evidence = Evidence(
+        # Create multiple test documents, each in its own file; PIL drops the
+        # GIL while encoding, so render them on worker threads
+        doc_paths = await asyncio.gather(*(
+            asyncio.to_thread(
+                self.create_test_document_image,
+                temp_dir, f"Legal document {i} containing case information.", f"document_{i}.png"
+            )
+            for i in range(5)
+        ))
+        
+        # Hash them in parallel; hashlib releases the GIL while digesting
+        hashes = await asyncio.gather(
+            *(asyncio.to_thread(_sha256_path, doc_path) for doc_path in doc_paths)
+        )
+        
+        evidence_items = [
+            Evidence(
                 id=f"doc-{i:03d}",
                 case_id=test_case.id,
-                filename=f"document_{i}.png",
+                filename=doc_path.name,
                 evidence_type=EvidenceType.DOCUMENT,
                 file_path=str(doc_path),
-                sha256_hash=hashlib.sha256(doc_path.read_bytes()).hexdigest()
+                sha256_hash=sha256_hash
             )
-            evidence_items.append(evidence)
+            for i, (doc_path, sha256_hash) in enumerate(zip(doc_paths, hashes))
+        ]
         
-        # Process all evidence concurrently
+        # Process all evidence concurrently, but cap in-flight OCR runs so
+        # the Tesseract subprocesses do not oversubscribe the CPU
         pipeline = DocumentPipeline(storage_service)
-        tasks = [pipeline.process(evidence) for evidence in evidence_items]
-        results = await asyncio.gather(*tasks)
+        semaphore = asyncio.Semaphore(min(os.cpu_count() or 2, 4))
+        
+        async def process(evidence):
+            async with semaphore:
+                return await pipeline.process(evidence)
+        
+        results = await asyncio.gather(*(process(evidence) for evidence in evidence_items))
         
         # Verify all items were processed successfully
         assert len(results) == 5
@@ -0,0 +1,35 @@
+"""JSON helpers shared by the test suite.
+
+Encoding and decoding go through orjson when it is installed and fall back
+to the standard library otherwise; either way ``dumps`` returns bytes.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def dumps_indented(obj: Any) -> bytes:
+    """Serialize to two-space indented JSON."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON payload."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)